@@ -17,6 +17,8 @@ Mocks server calls for testing
 """
 
 from base64 import b64encode
+import copy
+import functools
 import json
 import os
 import platform
@@ -27,6 +29,18 @@ from uuid import UUID
 import pytest
 from requests import HTTPError, Response
 
+# prefer orjson for (de)serializing mock payloads, it is considerably faster than stdlib json
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _dumps = json.dumps
+    _loads = json.loads
+
 from iqm.iqm_client import (
     DIST_NAME,
     REQUESTS_TIMEOUT,
@@ -53,19 +67,24 @@ def client_signature() -> str:
     return 'some-signature'
 
 
-@pytest.fixture()
+_SAMPLE_CALIBRATION_SET_ID = UUID('9ddb9586-8f27-49a9-90ed-41086b47f6bd')
+_EXISTING_RUN_ID = UUID('3c3fcda3-e860-46bf-92a4-bcc59fa76ce9')
+_MISSING_RUN_ID = UUID('059e4186-50a3-4e6c-ba1f-37fe6afbdfc2')
+
+
+@pytest.fixture(scope='session')
 def sample_calibration_set_id() -> UUID:
-    return UUID('9ddb9586-8f27-49a9-90ed-41086b47f6bd')
+    return _SAMPLE_CALIBRATION_SET_ID
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def existing_run_id() -> UUID:
-    return UUID('3c3fcda3-e860-46bf-92a4-bcc59fa76ce9')
+    return _EXISTING_RUN_ID
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def missing_run_id() -> UUID:
-    return UUID('059e4186-50a3-4e6c-ba1f-37fe6afbdfc2')
+    return _MISSING_RUN_ID
 
 
 @pytest.fixture()
@@ -102,30 +121,44 @@ def quantum_architecture_url(base_url) -> str:
     return f'{base_url}/quantum-architecture'
 
 
-@pytest.fixture
+_SETTINGS_PATH = os.path.dirname(os.path.realpath(__file__)) + '/resources/settings.json'
+
+# platform queries can be expensive and the result is constant for the life of the interpreter
+_USER_AGENT = f'{platform.platform(terse=True)}, python {platform.python_version()}, {DIST_NAME} {__version__}'
+
+
+@functools.lru_cache(maxsize=1)
+def _load_settings() -> dict:
+    """Reads and parses the static settings file once per session."""
+    with open(_SETTINGS_PATH, 'rb') as f:
+        return _loads(f.read())
+
+
+@pytest.fixture(scope='session')
 def settings_dict():
     """
     Reads and parses settings file into a dictionary
     """
-    settings_path = os.path.dirname(os.path.realpath(__file__)) + '/resources/settings.json'
-    with open(settings_path, 'r', encoding='utf-8') as f:
-        return json.loads(f.read())
+    return _load_settings()
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def sample_circuit_metadata():
     return {'experiment_type': 'test', 'qubits': (0, 1), 'values': [0.01686514, 0.05760602]}
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_circuit(sample_circuit_metadata):
     """
     A sample circuit for testing submit_circuit
+
+    Session-scoped since the tests do not mutate it (tests that modify a
+    circuit first take a deep copy).
     """
     return create_sample_circuit(['QB1', 'QB2'], metadata=sample_circuit_metadata)
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_circuit_logical(sample_circuit_metadata):
     """
     A sample circuit with logical names for testing submit_circuit
@@ -133,50 +166,63 @@ def sample_circuit_logical(sample_circuit_metadata):
     return create_sample_circuit(['Qubit A', 'Qubit B'], metadata=sample_circuit_metadata)
 
 
+# instruction arguments shared by the sample circuits; Instruction validation copies them,
+# so passing the same references is safe
+_PHASED_RX_ARGS = {'phase_t': 0.7, 'angle_t': 0.25}
+_PRX_ARGS = {'phase_t': 0.3, 'angle_t': -0.2}
+_EMPTY_ARGS: dict[str, Any] = {}
+
+
+@functools.lru_cache
+def _measurement_instruction(name: str, qubit: str, key: str) -> Instruction:
+    """Shared measurement instructions, validated once per unique (name, qubit, key)."""
+    return Instruction(name=name, qubits=(qubit,), args={'key': key})
+
+
 def create_sample_circuit(qubits: list[str], metadata) -> Circuit:
     return Circuit(
         name='The circuit',
-        instructions=[
+        instructions=(
             Instruction(
                 name='cz',
                 qubits=tuple(qubits),
-                args={},
+                args=_EMPTY_ARGS,
             ),
             Instruction(
                 name='phased_rx',
                 implementation='drag_gaussian',
                 qubits=(qubits[0],),
-                args={'phase_t': 0.7, 'angle_t': 0.25},
+                args=_PHASED_RX_ARGS,
             ),
             Instruction(
                 name='prx',
                 qubits=(qubits[0],),
-                args={'phase_t': 0.3, 'angle_t': -0.2},
+                args=_PRX_ARGS,
             ),
-            Instruction(name='measurement', qubits=(qubits[0],), args={'key': 'A'}),
-            Instruction(name='measure', qubits=(qubits[1],), args={'key': 'B'}),
-        ],
+            _measurement_instruction('measurement', qubits[0], 'A'),
+            _measurement_instruction('measure', qubits[1], 'B'),
+        ),
         metadata=metadata,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_resonator_circuit():
     instructions = (
         Instruction(
             name='prx',
             qubits=('QB1',),
-            args={'phase_t': 0.3, 'angle_t': -0.2},
+            args=_PRX_ARGS,
         ),
         Instruction(
             name='cz',
             qubits=('QB1', 'COMP_R'),
-            args={},
+            args=_EMPTY_ARGS,
         ),
         Instruction(
             name='cz',
             qubits=('QB2', 'COMP_R'),
-            args={},
+            args=_EMPTY_ARGS,
         ),
     )
     return Circuit(name='COMP_R circuit', instructions=instructions)
@@ -217,88 +263,81 @@ def sample_circuit_with_raw_instructions(sample_circuit_metadata):
     )
 
 
+@pytest.fixture(scope='session')
+def run_request_factory(sample_circuit):
+    """
+    Factory for building ``RunRequest``s around the shared sample circuit.
+
+    Keyword arguments override the defaults, so each test (or fixture below)
+    only specifies what differs from a minimal request.
+    """
+
+    def _make(**overrides) -> RunRequest:
+        kwargs: dict[str, Any] = {'circuits': [sample_circuit], 'shots': 10}
+        kwargs.update(overrides)
+        return RunRequest(**kwargs)
+
+    return _make
+
+
+_LOGICAL_QUBIT_MAPPING = [
+    SingleQubitMapping(logical_name='Qubit A', physical_name='QB1'),
+    SingleQubitMapping(logical_name='Qubit B', physical_name='QB2'),
+]
+
+
 @pytest.fixture()
-def minimal_run_request(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
-    )
+def minimal_run_request(run_request_factory) -> RunRequest:
+    return run_request_factory()
 
 
 @pytest.fixture()
-def run_request_with_heralding(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
-        heralding_mode=HeraldingMode.ZEROS,
-    )
+def run_request_with_heralding(run_request_factory) -> RunRequest:
+    return run_request_factory(heralding_mode=HeraldingMode.ZEROS)
 
 
 @pytest.fixture()
-def run_request_with_move_validation(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
-        move_validation_mode=MoveGateValidationMode.STRICT,
-    )
+def run_request_with_move_validation(run_request_factory) -> RunRequest:
+    return run_request_factory(move_validation_mode=MoveGateValidationMode.STRICT)
 
 
 @pytest.fixture()
-def run_request_with_incompatible_options(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
+def run_request_with_incompatible_options(run_request_factory) -> RunRequest:
+    return run_request_factory(
         move_validation_mode=MoveGateValidationMode.NONE,
         move_gate_frame_tracking_mode=MoveGateFrameTrackingMode.FULL,
     )
 
 
 @pytest.fixture()
-def run_request_without_prx_move_validation(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
-        move_validation_mode=MoveGateValidationMode.ALLOW_PRX,
-    )
+def run_request_without_prx_move_validation(run_request_factory) -> RunRequest:
+    return run_request_factory(move_validation_mode=MoveGateValidationMode.ALLOW_PRX)
 
 
 @pytest.fixture()
-def run_request_with_move_gate_frame_tracking(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
-        move_gate_frame_tracking_mode=MoveGateFrameTrackingMode.FULL,
-    )
+def run_request_with_move_gate_frame_tracking(run_request_factory) -> RunRequest:
+    return run_request_factory(move_gate_frame_tracking_mode=MoveGateFrameTrackingMode.FULL)
 
 
 @pytest.fixture()
-def run_request_with_custom_settings(sample_circuit_logical, settings_dict) -> RunRequest:
-    return RunRequest(
+def run_request_with_custom_settings(run_request_factory, sample_circuit_logical, settings_dict) -> RunRequest:
+    return run_request_factory(
         circuits=[sample_circuit_logical],
-        shots=10,
-        qubit_mapping=[
-            SingleQubitMapping(logical_name='Qubit A', physical_name='QB1'),
-            SingleQubitMapping(logical_name='Qubit B', physical_name='QB2'),
-        ],
+        qubit_mapping=_LOGICAL_QUBIT_MAPPING,
         custom_settings=settings_dict,
         heralding_mode=HeraldingMode.NONE,
     )
 
 
 @pytest.fixture()
-def run_request_without_qubit_mapping(sample_circuit) -> RunRequest:
-    return RunRequest(
-        circuits=[sample_circuit],
-        shots=10,
-        heralding_mode=HeraldingMode.NONE,
-    )
+def run_request_without_qubit_mapping(run_request_factory) -> RunRequest:
+    return run_request_factory(heralding_mode=HeraldingMode.NONE)
 
 
 @pytest.fixture()
-def run_request_with_invalid_qubit_mapping(sample_circuit_logical) -> RunRequest:
-    return RunRequest(
+def run_request_with_invalid_qubit_mapping(run_request_factory, sample_circuit_logical) -> RunRequest:
+    return run_request_factory(
         circuits=[sample_circuit_logical],
-        shots=10,
         qubit_mapping=[
             SingleQubitMapping(logical_name='Qubit A', physical_name='QB1'),
             SingleQubitMapping(logical_name='Qubit B', physical_name='QB1'),
@@ -308,10 +347,9 @@ def run_request_with_invalid_qubit_mapping(sample_circuit_logical) -> RunRequest
 
 
 @pytest.fixture()
-def run_request_with_incomplete_qubit_mapping(sample_circuit_logical) -> RunRequest:
-    return RunRequest(
+def run_request_with_incomplete_qubit_mapping(run_request_factory, sample_circuit_logical) -> RunRequest:
+    return run_request_factory(
         circuits=[sample_circuit_logical],
-        shots=10,
         qubit_mapping=[
             SingleQubitMapping(logical_name='Qubit A', physical_name='QB1'),
         ],
@@ -320,28 +358,22 @@ def run_request_with_incomplete_qubit_mapping(sample_circuit_logical) -> RunRequ
 
 
 @pytest.fixture()
-def run_request_with_calibration_set_id(sample_circuit_logical, sample_calibration_set_id) -> RunRequest:
-    return RunRequest(
+def run_request_with_calibration_set_id(
+    run_request_factory, sample_circuit_logical, sample_calibration_set_id
+) -> RunRequest:
+    return run_request_factory(
         circuits=[sample_circuit_logical],
-        shots=10,
-        qubit_mapping=[
-            SingleQubitMapping(logical_name='Qubit A', physical_name='QB1'),
-            SingleQubitMapping(logical_name='Qubit B', physical_name='QB2'),
-        ],
+        qubit_mapping=_LOGICAL_QUBIT_MAPPING,
         calibration_set_id=sample_calibration_set_id,
         heralding_mode=HeraldingMode.NONE,
     )
 
 
 @pytest.fixture()
-def run_request_with_duration_check_disabled(sample_circuit_logical) -> RunRequest:
-    return RunRequest(
+def run_request_with_duration_check_disabled(run_request_factory, sample_circuit_logical) -> RunRequest:
+    return run_request_factory(
         circuits=[sample_circuit_logical],
-        shots=10,
-        qubit_mapping=[
-            SingleQubitMapping(logical_name='Qubit A', physical_name='QB1'),
-            SingleQubitMapping(logical_name='Qubit B', physical_name='QB2'),
-        ],
+        qubit_mapping=_LOGICAL_QUBIT_MAPPING,
         max_circuit_duration_over_t2=0.0,
         heralding_mode=HeraldingMode.NONE,
     )
@@ -373,78 +405,77 @@ def deleted_job_result():
     return MockJsonResponse(200, {'status': 'deleted', 'metadata': {'request': {'shots': 1, 'circuits': []}}})
 
 
-@pytest.fixture()
-def ready_job_result(sample_circuit, sample_calibration_set_id):
-    return MockJsonResponse(
-        200,
-        {
-            'status': 'ready',
-            'measurements': [{'result': [[1, 0, 1, 1], [1, 0, 0, 1], [1, 0, 1, 1], [1, 0, 1, 1]]}],
-            'metadata': {
-                'calibration_set_id': str(sample_calibration_set_id),
-                'request': {
-                    'shots': 42,
-                    'circuits': [sample_circuit],
-                    'calibration_set_id': str(sample_calibration_set_id),
-                },
-                'timestamps': {
-                    'job_start': '0.0',
-                    'job_end': '1.1',
-                },
-            },
+@pytest.fixture(scope='session')
+def _ready_job_metadata(sample_circuit, sample_calibration_set_id) -> dict:
+    """Metadata of a finished job, built once per session since the tests never mutate it."""
+    return {
+        'calibration_set_id': str(sample_calibration_set_id),
+        'request': {
+            'shots': 42,
+            'circuits': [sample_circuit],
+            'calibration_set_id': str(sample_calibration_set_id),
         },
-    )
+        'timestamps': {
+            'job_start': '0.0',
+            'job_end': '1.1',
+        },
+    }
+
+
+@pytest.fixture(scope='session')
+def _ready_job_payload(_ready_job_metadata) -> dict:
+    return {
+        'status': 'ready',
+        'measurements': [{'result': [[1, 0, 1, 1], [1, 0, 0, 1], [1, 0, 1, 1], [1, 0, 1, 1]]}],
+        'metadata': _ready_job_metadata,
+    }
+
+
+@pytest.fixture(scope='session')
+def _job_payload_with_warnings(_ready_job_metadata) -> dict:
+    return {
+        'status': 'ready',
+        'metadata': _ready_job_metadata,
+        'warnings': ['This is a warning message'],
+    }
 
 
 @pytest.fixture()
-def job_result_with_warnings(sample_circuit, sample_calibration_set_id):
-    return MockJsonResponse(
-        200,
-        {
-            'status': 'ready',
-            'metadata': {
-                'calibration_set_id': str(sample_calibration_set_id),
-                'request': {
-                    'shots': 42,
-                    'circuits': [sample_circuit],
-                    'calibration_set_id': str(sample_calibration_set_id),
-                },
-                'timestamps': {
-                    'job_start': '0.0',
-                    'job_end': '1.1',
-                },
-            },
-            'warnings': ['This is a warning message'],
-        },
-    )
+def ready_job_result(_ready_job_payload):
+    return MockJsonResponse(200, _ready_job_payload)
 
 
 @pytest.fixture()
+def job_result_with_warnings(_job_payload_with_warnings):
+    return MockJsonResponse(200, _job_payload_with_warnings)
+
+
+@pytest.fixture(scope='session')
 def pending_compilation_status():
     return MockJsonResponse(200, {'status': 'pending compilation'})
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def pending_execution_status():
     return MockJsonResponse(200, {'status': 'pending execution'})
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def ready_status():
     return MockJsonResponse(200, {'status': 'ready'})
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def pending_deletion_status():
     return MockJsonResponse(200, {'status': 'pending deletion'})
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def deleted_status():
     return MockJsonResponse(200, {'status': 'deleted'})
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_quantum_architecture():
     return {
         'quantum_architecture': {
@@ -460,26 +491,30 @@ def sample_quantum_architecture():
     }
 
 
+_SAMPLE_MOVE_ARCHITECTURE = {
+    'quantum_architecture': {
+        'name': 'hercules',
+        'qubits': ['COMP_R', 'QB1', 'QB2', 'QB3'],
+        'qubit_connectivity': [
+            ['QB1', 'COMP_R'],
+            ['QB2', 'COMP_R'],
+            ['QB3', 'COMP_R'],
+        ],
+        'operations': {
+            'prx': [['QB1'], ['QB2'], ['QB3']],
+            'cz': [['QB1', 'COMP_R'], ['QB2', 'COMP_R']],
+            'move': [['QB3', 'COMP_R']],
+            'measure': [['QB1'], ['QB2'], ['QB3']],
+            'barrier': [],
+        },
+    }
+}
+
+
 @pytest.fixture
 def sample_move_architecture():
-    return {
-        'quantum_architecture': {
-            'name': 'hercules',
-            'qubits': ['COMP_R', 'QB1', 'QB2', 'QB3'],
-            'qubit_connectivity': [
-                ['QB1', 'COMP_R'],
-                ['QB2', 'COMP_R'],
-                ['QB3', 'COMP_R'],
-            ],
-            'operations': {
-                'prx': [['QB1'], ['QB2'], ['QB3']],
-                'cz': [['QB1', 'COMP_R'], ['QB2', 'COMP_R']],
-                'move': [['QB3', 'COMP_R']],
-                'measure': [['QB1'], ['QB2'], ['QB3']],
-                'barrier': [],
-            },
-        }
-    }
+    # some transpiler tests modify the architecture, so each test gets a fresh copy
+    return copy.deepcopy(_SAMPLE_MOVE_ARCHITECTURE)
 
 
 @pytest.fixture
@@ -540,7 +575,7 @@ class MockTextResponse:
         self.history = history
 
     def json(self):
-        return json.loads(self.text)
+        return _loads(self.text)
 
     def raise_for_status(self):
         if 400 <= self.status_code < 600:
@@ -557,20 +592,25 @@ class MockJsonResponse:
         self.status_code = status_code
         self.json_data = json_data
         self.history = history
+        self._text: Optional[str] = None
+        self._error = HTTPError(f'{status_code}', response=self) if 400 <= status_code < 600 else None
 
     @property
     def text(self):
-        return json.dumps(self.json_data)
+        # json_data is not expected to change, so serialize it only on the first access
+        if self._text is None:
+            self._text = _dumps(self.json_data)
+        return self._text
 
     def json(self):
         return self.json_data
 
     def raise_for_status(self):
-        if 400 <= self.status_code < 600:
-            raise HTTPError(f'{self.status_code}', response=self)
+        if self._error is not None:
+            raise self._error
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def not_valid_client_configuration_response() -> MockJsonResponse:
     return MockJsonResponse(400, {'detail': 'not a valid client configuration'})
 
@@ -580,7 +620,7 @@ def submit_success(existing_run_id) -> MockJsonResponse:
     return MockJsonResponse(201, {'id': str(existing_run_id)})
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def submit_failed_auth() -> MockJsonResponse:
     return MockJsonResponse(401, {'detail': 'unauthorized'})
 
@@ -600,7 +640,7 @@ def dynamic_quantum_architecture_success(sample_dynamic_quantum_architecture) ->
     return MockJsonResponse(200, sample_dynamic_quantum_architecture)
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def abort_job_success() -> MockJsonResponse:
     return MockJsonResponse(200, {})
 
@@ -610,6 +650,10 @@ def abort_job_failed() -> MockJsonResponse:
     return MockJsonResponse(400, {'detail': 'failed to abort job'})
 
 
+# empty JSON object used as the header and signature of every generated token
+_EMPTY_B64 = b64encode(b'{}').decode('ascii')
+
+
 def make_token(token_type: str, lifetime: int) -> str:
     """Encode given token type and expire time as a token.
 
@@ -620,10 +664,14 @@ def make_token(token_type: str, lifetime: int) -> str:
     Returns:
         Encoded token
     """
-    empty = b64encode('{}'.encode('utf-8')).decode('utf-8')
-    body = f'{{ "typ": "{token_type}", "exp": {int(time.time()) + lifetime} }}'
-    body = b64encode(body.encode('utf-8')).decode('utf-8')
-    return f'{empty}.{body}.{empty}'
+    body = f'{{ "typ": "{token_type}", "exp": {int(time.time()) + lifetime} }}'.encode()
+    return f'{_EMPTY_B64}.{b64encode(body).decode("ascii")}.{_EMPTY_B64}'
+
+
+# header/kwargs templates for the common unauthenticated case; the tests only read them
+_BASE_HEADERS_NO_RR = {'User-Agent': _USER_AGENT}
+_BASE_HEADERS_RR = {'Expect': '100-Continue', 'User-Agent': _USER_AGENT}
+_BASE_KW_NO_RR = {'headers': _BASE_HEADERS_NO_RR, 'timeout': REQUESTS_TIMEOUT}
 
 
 def post_jobs_args(
@@ -632,15 +680,20 @@ def post_jobs_args(
     access_token: Optional[str] = None,
 ) -> dict[str, Any]:
     """Returns expected kwargs of POST /jobs request"""
-    headers = {'Expect': '100-Continue'} if run_request is not None else {}
-    signature = f'{platform.platform(terse=True)}, python {platform.python_version()}, {DIST_NAME} {__version__}'
-    headers['User-Agent'] = signature if user_agent is None else user_agent
-    if access_token is not None:
-        headers['Authorization'] = f'Bearer {access_token}'
+    if user_agent is None and access_token is None:
+        if run_request is None:
+            return _BASE_KW_NO_RR
+        headers = _BASE_HEADERS_RR
+    else:
+        headers = dict(_BASE_HEADERS_NO_RR if run_request is None else _BASE_HEADERS_RR)
+        if user_agent is not None:
+            headers['User-Agent'] = user_agent
+        if access_token is not None:
+            headers['Authorization'] = f'Bearer {access_token}'
     if run_request is None:
         return {'headers': headers, 'timeout': REQUESTS_TIMEOUT}
     return {
-        'json': json.loads(run_request.model_dump_json(exclude_none=True)),
+        'json': run_request.model_dump(mode='json', exclude_none=True),
         'headers': headers,
         'timeout': REQUESTS_TIMEOUT,
     }
@@ -651,32 +704,51 @@ def get_jobs_args(
     access_token: Optional[str] = None,
 ) -> dict[str, Any]:
     """Returns expected kwargs of POST /jobs request"""
-    headers = {}
-    signature = f'{platform.platform(terse=True)}, python {platform.python_version()}, {DIST_NAME} {__version__}'
-    headers['User-Agent'] = signature if user_agent is None else user_agent
+    if user_agent is None and access_token is None:
+        return _BASE_KW_NO_RR
+    headers = dict(_BASE_HEADERS_NO_RR)
+    if user_agent is not None:
+        headers['User-Agent'] = user_agent
     if access_token is not None:
         headers['Authorization'] = f'Bearer {access_token}'
     return {
-        'headers': headers if headers else None,
+        'headers': headers,
         'timeout': REQUESTS_TIMEOUT,
     }
 
 
+@functools.lru_cache(maxsize=64)
+def _compilation_options(
+    max_circuit_duration_over_t2: Optional[float],
+    heralding_mode: HeraldingMode,
+    move_gate_validation: MoveGateValidationMode,
+    move_gate_frame_tracking: MoveGateFrameTrackingMode,
+) -> CircuitCompilationOptions:
+    """Memoized options construction, since parametrized tests keep requesting the same combinations."""
+    return CircuitCompilationOptions(
+        max_circuit_duration_over_t2=max_circuit_duration_over_t2,
+        heralding_mode=heralding_mode,
+        move_gate_validation=move_gate_validation,
+        move_gate_frame_tracking=move_gate_frame_tracking,
+    )
+
+
 def submit_circuits_args(run_request: RunRequest) -> dict[str, Any]:
     """Return args to be used with submit_circuits to generate the expected RunRequest"""
-    qm_dict = None
-    if run_request.qubit_mapping is not None:
-        qm_dict = {qm.logical_name: qm.physical_name for qm in run_request.qubit_mapping}
     return {
         'circuits': run_request.circuits,
-        'qubit_mapping': qm_dict,
+        'qubit_mapping': (
+            {qm.logical_name: qm.physical_name for qm in run_request.qubit_mapping}
+            if run_request.qubit_mapping is not None
+            else None
+        ),
         'custom_settings': run_request.custom_settings,
         'calibration_set_id': run_request.calibration_set_id,
         'shots': run_request.shots,
-        'options': CircuitCompilationOptions(
-            max_circuit_duration_over_t2=run_request.max_circuit_duration_over_t2,
-            heralding_mode=run_request.heralding_mode,
-            move_gate_validation=run_request.move_validation_mode,
-            move_gate_frame_tracking=run_request.move_gate_frame_tracking_mode,
+        'options': _compilation_options(
+            run_request.max_circuit_duration_over_t2,
+            run_request.heralding_mode,
+            run_request.move_validation_mode,
+            run_request.move_gate_frame_tracking_mode,
         ),
     }
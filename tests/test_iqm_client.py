@@ -639,7 +639,7 @@ def test_validate_circuit_checks_instruction_name_is_supported(sample_circuit):
     Tests that custom Pydantic validator (triggered via <validate_circuit>)
     catches when instruction name is set to an unknown instruction type
     """
-    circuit = sample_circuit.model_copy()
+    circuit = sample_circuit.model_copy(deep=True)
     circuit.instructions[0].name = 'kaboom'
     with pytest.raises(ValueError, match='Unknown instruction "kaboom"'):
         validate_circuit(circuit)
@@ -650,7 +650,7 @@ def test_validate_circuit_checks_instruction_implementation_is_string(sample_cir
     Tests that custom Pydantic validator (triggered via <validate_circuit>)
     catches when instruction implementation is set to an empty string
     """
-    circuit = sample_circuit.model_copy()
+    circuit = sample_circuit.model_copy(deep=True)
     circuit.instructions[0].implementation = ''
     with pytest.raises(ValueError, match='Implementation of the instruction should be None, or a non-empty string'):
         validate_circuit(circuit)
@@ -662,7 +662,7 @@ def test_validate_circuit_checks_instruction_qubit_count(sample_circuit):
     catches when qubit count of the instruction does not match the arity of
     that instruction
     """
-    circuit = sample_circuit.model_copy()
+    circuit = sample_circuit.model_copy(deep=True)
     circuit.instructions[0].qubits += ('Qubit C',)
     with pytest.raises(ValueError, match=r'The "cz" instruction acts on 2 qubit\(s\), but 3 were given'):
         validate_circuit(circuit)
@@ -673,7 +673,7 @@ def test_validate_circuit_checks_instruction_argument_names(sample_circuit):
     Tests that custom Pydantic validator (triggered via <validate_circuit>)
     catches when submitted argument names of the instruction are not supported
     """
-    circuit = sample_circuit.model_copy()
+    circuit = sample_circuit.model_copy(deep=True)
     circuit.instructions[1].args['arg_x'] = 'This argument name is not supported by the instruction'
     with pytest.raises(ValueError, match='The instruction "prx" requires'):
         validate_circuit(circuit)
@@ -684,7 +684,7 @@ def test_validate_circuit_checks_instruction_argument_types(sample_circuit):
     Tests that custom Pydantic validator (triggered via <validate_circuit>)
     catches when submitted argument types of the instruction are not supported
     """
-    circuit = sample_circuit.model_copy()
+    circuit = sample_circuit.model_copy(deep=True)
     circuit.instructions[1].args['phase_t'] = '0.7'
     with pytest.raises(TypeError, match='The argument "phase_t" should be of one of the following supported types'):
         validate_circuit(circuit)